@@ -0,0 +1,14 @@
+import pytest
+
+import aesara
+from aesara.tensor.type import fscalar
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_c_cache():
+    # Compile a canonical scalar graph once per session so that later
+    # C compilations hit the on-disk module cache instead of paying the
+    # cold-cache build cost in whichever test happens to run first.
+    if aesara.config.cxx:
+        x = fscalar("x")
+        aesara.function([x], aesara.tensor.exp(x))